@@ -8,7 +8,8 @@
     necessary HTTP headers before handling the message back to Zeep to be sent \
     as a POST request.
 """
+from .bulk_upload import MtomBulkUploader
 from .mtom_attachment import MtomAttachment
 from .mtom_transport import MtomTransport
 
-__all__ = ["MtomAttachment", "MtomTransport"]
+__all__ = ["MtomAttachment", "MtomBulkUploader", "MtomTransport"]
@@ -0,0 +1,219 @@
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from zeep import Client
+from zeep.proxy import ServiceProxy
+
+from .mtom_attachment import MtomAttachment
+from .mtom_transport import MtomTransport
+
+
+class BulkUploadResult:
+    def __init__(
+        self,
+        index: int,
+        response: Any = None,
+        error: Exception | None = None,
+        elapsed: float = 0.0,
+    ) -> None:
+        """Represents the outcome of one call made by the MtomBulkUploader.
+
+        Args:
+            index (int): position of the call in the input iterable
+            response (Any, optional): value returned by Zeep for the operation. Defaults to None.
+            error (Exception | None, optional): exception raised by the call. Defaults to None.
+            elapsed (float, optional): duration of the call in seconds. Defaults to 0.0.
+        """
+        self.index: int = index
+        self.response: Any = response
+        self.error: Exception | None = error
+        self.elapsed: float = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkUploadStats:
+    def __init__(self) -> None:
+        """Aggregate throughput of a MtomBulkUploader run, updated as results complete.
+
+        Only successful calls count towards documents_per_second and \
+        attachment_bytes. attachment_bytes is the size of the attached files, \
+        the SOAP Envelope, MIME headers and boundaries are not included.
+        """
+        self.completed: int = 0
+        self.succeeded: int = 0
+        self.failed: int = 0
+        self.attachment_bytes: int = 0
+        self.started_at: float = time.perf_counter()
+        self.elapsed: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def attachment_bytes_per_second(self) -> float:
+        return self.attachment_bytes / self.elapsed if self.elapsed else 0.0
+
+    def add(self, result: BulkUploadResult, size: int):
+        self.completed += 1
+        if result.ok:
+            self.succeeded += 1
+            self.attachment_bytes += size
+        else:
+            self.failed += 1
+        self.elapsed = time.perf_counter() - self.started_at
+        return None
+
+
+class BulkUploadRun:
+    def __init__(self, results: Iterator[BulkUploadResult], stats: BulkUploadStats) -> None:
+        """Iterator over the results of one MtomBulkUploader run.
+
+        Args:
+            results (Iterator[BulkUploadResult]): results in completion order
+            stats (BulkUploadStats): throughput of this run
+        """
+        self.stats: BulkUploadStats = stats
+        self.__results: Iterator[BulkUploadResult] = results
+
+    def __iter__(self) -> "BulkUploadRun":
+        return self
+
+    def __next__(self) -> BulkUploadResult:
+        return next(self.__results)
+
+    def close(self):
+        """Stops the run, cancelling the calls not started yet"""
+        self.__results.close()  # type: ignore
+        return None
+
+
+class MtomBulkUploader:
+    """
+    Calls one operation many times with bounded concurrency
+
+    Calls are made through the client's own MtomTransport and service, so \
+    the HTTP session, default SOAP headers, binding and address are the ones \
+    the client already uses. Each call's attachments are set with the \
+    transport's use_files, so they never mix between concurrent calls.
+
+    The session's connection pool is not changed. If max_workers is greater \
+    than its pool size (10 by default in requests), mount an adapter with a \
+    larger pool_maxsize on the session to reuse connections across workers.
+
+    Methods:
+        - run: calls the operation for each item and yields the results as they complete
+
+    Arguments:
+        - client: zeep Client using a MtomTransport
+        - operation: name of the operation to be called (e.g. "uploadFile")
+        - max_workers: maximum number of concurrent calls
+        - max_pending: maximum number of items read from the input and not \
+        yet yielded as results. Defaults to twice max_workers.
+        - service: ServiceProxy of the client to call the operation on (e.g. \
+        from client.bind or client.create_service). Defaults to client.service.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        operation: str,
+        max_workers: int = 8,
+        max_pending: int | None = None,
+        service: ServiceProxy | None = None,
+    ) -> None:
+        if not isinstance(client.transport, MtomTransport):
+            raise TypeError(
+                f"client transport must be a MtomTransport not {client.transport.__class__.__name__}"
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.client: Client = client
+        self.transport: MtomTransport = client.transport
+        self.operation: str = operation
+        self.max_workers: int = max_workers
+        self.max_pending: int = max(max_pending or 2 * max_workers, max_workers)
+        self.service: ServiceProxy = service if service is not None else client.service
+
+    def run(self, items: Iterable[tuple[tuple, list[MtomAttachment]]]) -> BulkUploadRun:
+        """Calls the operation once for each item, yielding results in completion order.
+
+        Items are read from the iterable only as pending calls complete, so a \
+        generator creating the MtomAttachment objects on demand keeps memory \
+        bounded regardless of the number of items.
+
+        Args:
+            items (Iterable[tuple[tuple, list[MtomAttachment]]]): pairs of \
+            (operation args, attachments) for each call
+
+        Returns:
+            BulkUploadRun: iterator with one BulkUploadResult per item and the \
+            stats of this run. Exceptions raised by a call are stored in the \
+            result's error attribute instead of being raised.
+
+            If reading the items raises, no more items are read, the results of \
+            the calls already made are yielded and then the exception is raised.
+        """
+        stats = BulkUploadStats()
+        return BulkUploadRun(results=self.__results(items=items, stats=stats), stats=stats)
+
+    def __results(
+        self, items: Iterable[tuple[tuple, list[MtomAttachment]]], stats: BulkUploadStats
+    ) -> Iterator[BulkUploadResult]:
+        stats.started_at = time.perf_counter()
+
+        items_iter = enumerate(items)
+        pending: dict[Future, tuple[int, int]] = {}
+        input_error: Exception | None = None
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                if input_error is None:
+                    try:
+                        for index, (args, files) in items_iter:
+                            size = sum(len(f.file_data) for f in files)
+                            future = executor.submit(self.__call, args, files)
+                            pending[future] = (index, size)
+                            if len(pending) >= self.max_pending:
+                                break
+                    except Exception as e:
+                        # stop reading, but report the calls already made
+                        input_error = e
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, size = pending.pop(future)
+                    response, error, elapsed = future.result()
+
+                    result = BulkUploadResult(
+                        index=index, response=response, error=error, elapsed=elapsed
+                    )
+                    stats.add(result=result, size=size)
+                    yield result
+
+            if input_error is not None:
+                raise input_error
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __call(
+        self, args: tuple, files: list[MtomAttachment]
+    ) -> tuple[Any, Exception | None, float]:
+        start = time.perf_counter()
+        try:
+            with self.transport.use_files(files=files):
+                response = getattr(self.service, self.operation)(*args)
+        except Exception as e:
+            return None, e, time.perf_counter() - start
+
+        return response, None, time.perf_counter() - start
@@ -28,7 +28,9 @@ class MtomAttachment:
         self.file_name: str
         self.file_data: bytes
 
-        self.__handle_file_input(file=file, file_name=file_name)
+        self.file_path, self.file_name, self.file_data = self.__handle_file_input(
+            file=file, file_name=file_name
+        )
 
         # MIME header attributes
         self.content_type = self.__get_content_type()
@@ -62,31 +64,29 @@ class MtomAttachment:
         return headers.encode()
 
     @classmethod
-    def __handle_file_input(cls, file: str | BytesIO, file_name: str | None = None):
+    def __handle_file_input(
+        cls, file: str | BytesIO, file_name: str | None = None
+    ) -> tuple[str | None, str, bytes]:
         if isinstance(file, str):
-            cls.__handle_file_as_path(file=file)
+            return cls.__handle_file_as_path(file=file)
         elif isinstance(file, BytesIO):
             if not file_name:
                 raise ValueError("Error while handling file, file_name must be provided if file is a BytesIO object")
-            cls.__handle_file_as_bytesio(file=file, file_name=file_name)
+            return cls.__handle_file_as_bytesio(file=file, file_name=file_name)
         else:
             raise TypeError("Error while handling file, file must be a file path (str) or BytesIO object")
-        return None
 
     @classmethod
-    def __handle_file_as_path(cls, file: str):
-        cls.file_path = file
-        cls.file_name = os.path.basename(file)
+    def __handle_file_as_path(cls, file: str) -> tuple[str | None, str, bytes]:
         with open(file, mode="rb") as f:
-            cls.file_data = f.read()
-        return None
+            file_data = f.read()
+        return file, os.path.basename(file), file_data
 
     @classmethod
-    def __handle_file_as_bytesio(cls, file: BytesIO, file_name: str):
-        cls.file_path = None
-        cls.file_name = file_name
-        cls.file_data = file.read()
-        return None
+    def __handle_file_as_bytesio(
+        cls, file: BytesIO, file_name: str
+    ) -> tuple[str | None, str, bytes]:
+        return None, file_name, file.read()
 
     def __get_content_type(self) -> str:
         if not self.file_name:
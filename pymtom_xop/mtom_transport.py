@@ -1,9 +1,14 @@
+import threading
+from contextlib import contextmanager
+
 from lxml.etree import _Element
+from zeep import Client
+from zeep.proxy import ServiceProxy
 from zeep.transports import Transport
 
 from .mtom_attachment import MtomAttachment
 from .soap_envelope import SoapEnvelope
-from .xop_package import XopPackage
+from .xop_package import XopPackage, XopPackageFile
 
 
 class MtomTransport(Transport):
@@ -16,7 +21,10 @@ class MtomTransport(Transport):
 
     Methods:
         - add_files: adds files to the MtomTransport
+        - use_files: uses other files for the requests made by the current thread
         - update_headers: update the headers used in the request
+        - save_xml: saves the MTOM message to a file to be sent later
+        - post_package: sends a MTOM message previously saved with save_xml
 
     Arguments from zeep.Transport:
         :param cache: The cache object to be used to cache GET requests
@@ -33,6 +41,9 @@ class MtomTransport(Transport):
 
         self.headers: dict[str, str] = {}
 
+        # per thread state used by save_xml and use_files
+        self.__local = threading.local()
+
     def generate_http_headers(self, start_cid: str, boundary: str | bytes):
         """Generates and sets the necessary HTTP MTOM-XOP headers for the request.
 
@@ -76,19 +87,51 @@ class MtomTransport(Transport):
             Arguments:
                 - files: must be a list of MtomAttachment objects
         """
+        self.__assert_mtom_attachments(files=files)
+
+        self.files.extend(files)
+        self.__assert_unique_file_cids(files=self.files)
+        return None
+
+    @contextmanager
+    def use_files(self, files: list[MtomAttachment]):
+        """
+            Uses files instead of the transport's files for the requests \
+            made by the current thread while the context is active
+
+            Other threads keep using their own files, so one transport \
+            can be shared by concurrent calls.
+
+            Arguments:
+                - files: must be a list of MtomAttachment objects
+        """
+        self.__assert_mtom_attachments(files=files)
+        self.__assert_unique_file_cids(files=files)
+
+        previous = getattr(self.__local, "files", None)
+        self.__local.files = files
+        try:
+            yield
+        finally:
+            self.__local.files = previous
+
+    def __get_files(self) -> list[MtomAttachment]:
+        files: list[MtomAttachment] | None = getattr(self.__local, "files", None)
+        return self.files if files is None else files
+
+    @staticmethod
+    def __assert_mtom_attachments(files: list[MtomAttachment]):
         for f in files:
             if not isinstance(f, MtomAttachment):
                 raise TypeError(
                     f"files in the list must be MtomAttachment objects not {f.__class__.__name__}"
                 )
-
-        self.files.extend(files)
-        self.__assert_unique_file_cids()
         return None
 
-    def __assert_unique_file_cids(self):
+    @staticmethod
+    def __assert_unique_file_cids(files: list[MtomAttachment]):
         file_cids = []
-        for f in self.files:
+        for f in files:
             if f.cid in file_cids:
                 f.generate_new_cid()
             file_cids.append(f.cid)
@@ -102,20 +145,119 @@ class MtomTransport(Transport):
 
         Handles message back to Zeep for the POST request.
         """
-        soap_env = SoapEnvelope(env_el=message, files=self.files)
+        xop_pack, headers = self.__build_package(message=message, headers=headers)
+
+        # called from save_xml: keep the request instead of posting it
+        save_path: str | None = getattr(self.__local, "save_path", None)
+        if save_path is not None:
+            xop_pack.save(file_path=save_path, headers=headers)
+            return None
 
-        xop_pack = XopPackage(soap_env=soap_env, files=self.files)
+        # give the message back to Zeep to be posted
+        response = super().post(address, xop_pack.package, headers)
+
+        return response
+
+    def save_xml(
+        self,
+        file_path: str,
+        client: Client,
+        operation: str,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        service: ServiceProxy | None = None,
+    ):
+        """
+        Builds the MTOM message for an operation call and saves it to a file \
+        instead of sending it.
+
+        The operation is called through Zeep as usual, so the file holds the \
+        same HTTP headers (e.g. SOAPAction) and XOP package that post_xml would \
+        send. It can be sent later, many times or from another process, with \
+        post_package without the original files.
+
+        Arguments:
+            - file_path: path of the file to be written
+            - client: zeep Client using this transport
+            - operation: name of the operation to be called (e.g. "uploadFile")
+            - args: positional arguments of the operation
+            - kwargs: keyword arguments of the operation
+            - service: ServiceProxy of the client to call the operation on. \
+            Defaults to client.service.
+        """
+        if client.transport is not self:
+            raise ValueError("client must use this MtomTransport to save messages")
+
+        if service is None:
+            service = client.service
+
+        self.__local.save_path = file_path
+        try:
+            # raw_response keeps Zeep from parsing the reply that is never received
+            with client.settings(raw_response=True):
+                getattr(service, operation)(*args, **(kwargs or {}))
+        finally:
+            self.__local.save_path = None
+        return None
+
+    def post_package(
+        self,
+        address: str,
+        file_path: str,
+        headers: dict[str, str] | None = None,
+        service: ServiceProxy | None = None,
+        operation: str | None = None,
+    ):
+        """
+        Sends a MTOM message previously saved with save_xml.
+
+        The XOP package is streamed from the file, it is not rebuilt nor \
+        loaded into memory.
+
+        By default the unparsed requests.Response is returned and SOAP faults \
+        must be checked by the caller. If service and operation are given, \
+        the response is processed by Zeep the same way as a regular call: \
+        faults are raised and the operation's output is returned.
+
+        Arguments:
+            - address: URL for the request
+            - file_path: path of the file written by save_xml
+            - headers: HTTP headers to add to or override the saved ones
+            - service: zeep ServiceProxy the message was created for (e.g. client.service)
+            - operation: name of the operation the message was created for
+        """
+        if (service is None) != (operation is None):
+            raise ValueError("service and operation must be given together")
+
+        xop_file = XopPackageFile(file_path=file_path)
+
+        request_headers = dict(xop_file.headers)
+        if headers:
+            request_headers.update(headers)
+
+        with xop_file.open_body() as body:
+            response = super().post(address, body, request_headers)
+
+        if service is None:
+            return response
+
+        binding = service._binding
+        return binding.process_reply(service._client, binding.get(operation), response)
+
+    def __build_package(
+        self, message: _Element, headers: dict[str, str] | None
+    ) -> tuple[XopPackage, dict[str, str]]:
+        files = self.__get_files()
+
+        soap_env = SoapEnvelope(env_el=message, files=files)
+
+        xop_pack = XopPackage(soap_env=soap_env, files=files)
 
         mtom_xop_headers = self.generate_http_headers(
             start_cid=soap_env.get_cid(), boundary=xop_pack.boundary
         )
 
-        if not headers:
-            headers = mtom_xop_headers
-        else:
-            headers.update(mtom_xop_headers)
-
-        # give the message back to Zeep to be posted
-        response = super().post(address, xop_pack.package, headers)
+        # copy so the caller's dict is left untouched
+        headers = {**(headers or {}), **mtom_xop_headers}
 
-        return response
+        return xop_pack, headers
@@ -1,3 +1,6 @@
+import os
+import tempfile
+from typing import BinaryIO
 from uuid import uuid4
 
 from .mtom_attachment import MtomAttachment
@@ -19,6 +22,41 @@ class XopPackage:
 
         self.package: bytes = self.__parse_package()
 
+    def save(self, file_path: str, headers: dict[str, str]):
+        """Saves the HTTP headers and the XOP package to a file \
+        so it can be sent later with XopPackageFile.
+
+        The file is written to a temporary file in the same folder and then \
+        moved to file_path, so readers never see a partially written package.
+
+        Args:
+            file_path (str): path of the file to be written
+            headers (dict[str, str]): HTTP headers of the request
+
+        Raises:
+            ValueError: if a header name or value contains CR or LF
+        """
+        for k, v in headers.items():
+            if any(c in str(k) + str(v) for c in "\r\n"):
+                raise ValueError(
+                    f"Error while saving XOP package, header {k!r} must not contain CR or LF"
+                )
+
+        header_block = "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(file_path)), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, mode="wb") as f:
+                f.write(header_block.encode() + b"\r\n")
+                f.write(self.package)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return None
+
     def __parse_package(self):
         # initial boundary
         xop_package = b"--" + self.boundary + b"\r\n"
@@ -38,3 +76,51 @@ class XopPackage:
         xop_package += b"--" + self.boundary + b"--"
 
         return xop_package
+
+
+class XopPackageFile:
+    def __init__(self, file_path: str) -> None:
+        """Represents a XOP package saved to disk with XopPackage.save.
+
+        Only the HTTP headers are read when initialized, the package itself \
+        stays on disk until open_body is called.
+
+        Args:
+            file_path (str): path of the file written by XopPackage.save
+        """
+        self.file_path: str = file_path
+
+        self.headers: dict[str, str]
+        self.body_offset: int
+
+        self.headers, self.body_offset = self.__read_headers()
+
+    def open_body(self) -> BinaryIO:
+        """Opens the file positioned at the start of the XOP package.
+
+        The caller is responsible for closing the returned file object.
+        """
+        f = open(self.file_path, mode="rb")
+        f.seek(self.body_offset)
+        return f
+
+    def __read_headers(self) -> tuple[dict[str, str], int]:
+        headers: dict[str, str] = {}
+
+        with open(self.file_path, mode="rb") as f:
+            for line in f:
+                if line == b"\r\n":
+                    return headers, f.tell()
+                try:
+                    name, sep, value = line.decode().partition(":")
+                except UnicodeDecodeError:
+                    sep = ""
+                if not sep or not line.endswith(b"\r\n"):
+                    raise ValueError(
+                        f"Error while reading {self.file_path}, invalid header line: {line!r}"
+                    )
+                headers[name] = value.strip()
+
+        raise ValueError(
+            f"Error while reading {self.file_path}, end of headers not found"
+        )
@@ -0,0 +1,223 @@
+from io import BytesIO
+
+import pytest
+import responses
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from zeep import Client
+from zeep.settings import Settings
+from zeep.transports import Transport
+
+from pymtom_xop import MtomAttachment, MtomBulkUploader, MtomTransport
+
+
+def make_items(client: Client, count: int):
+    factory = client.type_factory("ns0")
+
+    for i in range(count):
+        file = MtomAttachment(file=BytesIO(f'test {i}'.encode()), file_name=f'test{i}.pdf')
+        body = factory.uploadFileWs(
+            file=file.get_cid(),
+            fileName=f"test{i}",
+            fileExtension="pdf"
+        )
+        yield (body,), [file]
+
+
+@responses.activate
+def test_bulk_upload():
+    responses.add(
+        responses.POST,
+        "https://service-test.com/UploadFileWs",
+        body='mock response',
+        status=200
+    )
+
+    conf = Settings(raw_response=True)  # type: ignore
+
+    client = Client(
+        wsdl="documents/UploadWSDL.wsdl", transport=MtomTransport(), settings=conf
+    )
+
+    uploader = MtomBulkUploader(client=client, operation="uploadFile", max_workers=3)
+
+    run = uploader.run(items=make_items(client=client, count=10))
+    results = list(run)
+
+    assert sorted(r.index for r in results) == list(range(10))
+    assert all(r.ok and r.response.status_code == 200 for r in results)
+
+    assert run.stats.completed == 10
+    assert run.stats.succeeded == 10
+    assert run.stats.failed == 0
+    assert run.stats.attachment_bytes == sum(len(f'test {i}') for i in range(10))
+    assert run.stats.documents_per_second > 0
+
+    # each request only carries its own attachment
+    for call in responses.calls:
+        body = call.request.body
+        assert body.count(b'Content-Disposition: attachment') == 1
+
+        name = body.split(b'name="test')[1].split(b'.pdf"')[0]
+        assert b'test ' + name + b'\r\n--uuid:' in body
+
+
+@responses.activate
+def test_bulk_upload_errors():
+    # no mocked response registered, every call raises ConnectionError
+    client = Client(wsdl="documents/UploadWSDL.wsdl", transport=MtomTransport())
+
+    uploader = MtomBulkUploader(client=client, operation="uploadFile", max_workers=2)
+
+    run = uploader.run(items=make_items(client=client, count=3))
+    results = list(run)
+
+    assert len(results) == 3
+    assert all(isinstance(r.error, Exception) for r in results)
+    assert run.stats.failed == 3
+    assert run.stats.documents_per_second == 0
+    assert run.stats.attachment_bytes_per_second == 0
+
+
+@responses.activate
+def test_bulk_upload_stats_per_run():
+    responses.add(responses.POST, "https://service-test.com/UploadFileWs", status=200)
+
+    conf = Settings(raw_response=True)  # type: ignore
+
+    client = Client(
+        wsdl="documents/UploadWSDL.wsdl", transport=MtomTransport(), settings=conf
+    )
+
+    uploader = MtomBulkUploader(client=client, operation="uploadFile", max_workers=2)
+
+    run1 = uploader.run(items=make_items(client=client, count=4))
+    next(run1)
+
+    run2 = uploader.run(items=make_items(client=client, count=2))
+    list(run2)
+    list(run1)
+
+    assert run1.stats.completed == 4
+    assert run2.stats.completed == 2
+
+
+@responses.activate
+def test_bulk_upload_keeps_session():
+    responses.add(responses.POST, "https://service-test.com/UploadFileWs", status=200)
+
+    adapter = HTTPAdapter(max_retries=Retry(total=3), pool_maxsize=4)
+
+    transport = MtomTransport()
+    transport.session.mount("https://", adapter)
+    transport.session.headers["User-Agent"] = "MyApp/1.0"
+
+    conf = Settings(raw_response=True)  # type: ignore
+
+    client = Client(wsdl="documents/UploadWSDL.wsdl", transport=transport, settings=conf)
+
+    uploader = MtomBulkUploader(client=client, operation="uploadFile", max_workers=3)
+
+    results = list(uploader.run(items=make_items(client=client, count=5)))
+    assert all(r.ok for r in results)
+
+    mounted = transport.session.get_adapter("https://service-test.com/UploadFileWs")
+    assert mounted is adapter
+    assert mounted.max_retries.total == 3
+
+    assert transport.session.headers["User-Agent"] == "MyApp/1.0"
+    for call in responses.calls:
+        assert call.request.headers["User-Agent"] == "MyApp/1.0"
+
+
+@responses.activate
+def test_bulk_upload_uses_client_transport():
+    responses.add(responses.POST, "https://service-test.com/UploadFileWs", status=200)
+
+    class CountingTransport(MtomTransport):
+        def __init__(self):
+            super().__init__()
+            self.posts = 0
+
+        def post_xml(self, address, message, headers):
+            self.posts += 1
+            return super().post_xml(address, message, headers)
+
+    transport = CountingTransport()
+
+    conf = Settings(raw_response=True)  # type: ignore
+
+    client = Client(wsdl="documents/UploadWSDL.wsdl", transport=transport, settings=conf)
+
+    uploader = MtomBulkUploader(client=client, operation="uploadFile", max_workers=2)
+
+    list(uploader.run(items=make_items(client=client, count=3)))
+
+    assert transport.posts == 3
+    # the transport's own files are left untouched
+    assert transport.files == []
+
+
+@responses.activate
+def test_bulk_upload_input_error():
+    responses.add(responses.POST, "https://service-test.com/UploadFileWs", status=200)
+
+    conf = Settings(raw_response=True)  # type: ignore
+
+    client = Client(
+        wsdl="documents/UploadWSDL.wsdl", transport=MtomTransport(), settings=conf
+    )
+
+    def failing_items():
+        yield from make_items(client=client, count=2)
+        raise FileNotFoundError("missing.pdf")
+
+    uploader = MtomBulkUploader(client=client, operation="uploadFile", max_workers=2)
+
+    run = uploader.run(items=failing_items())
+
+    results = []
+    with pytest.raises(FileNotFoundError, match='missing.pdf'):
+        for result in run:
+            results.append(result)
+
+    # the uploads already sent are still reported
+    assert sorted(r.index for r in results) == [0, 1]
+    assert all(r.ok for r in results)
+    assert len(responses.calls) == 2
+    assert run.stats.succeeded == 2
+
+
+@responses.activate
+def test_bulk_upload_soapheaders_and_service():
+    responses.add(responses.POST, "https://other-service.com/UploadFileWs", status=200)
+
+    conf = Settings(raw_response=True)  # type: ignore
+
+    client = Client(
+        wsdl="documents/UploadWSDL.wsdl", transport=MtomTransport(), settings=conf
+    )
+
+    token = etree.Element("{http://service-test.com/auth}Token")
+    token.text = "secret-token"
+    client.set_default_soapheaders([token])
+
+    binding_name = list(client.wsdl.bindings.keys())[0]
+    service = client.create_service(binding_name, "https://other-service.com/UploadFileWs")
+
+    uploader = MtomBulkUploader(client=client, operation="uploadFile", service=service)
+
+    results = list(uploader.run(items=make_items(client=client, count=2)))
+
+    assert all(r.ok for r in results)
+    for call in responses.calls:
+        assert call.request.url == "https://other-service.com/UploadFileWs"
+        assert b'secret-token' in call.request.body
+
+
+def test_bulk_upload_requires_mtom_transport():
+    client = Client(wsdl="documents/UploadWSDL.wsdl", transport=Transport())
+
+    with pytest.raises(TypeError, match='must be a MtomTransport'):
+        MtomBulkUploader(client=client, operation="uploadFile")
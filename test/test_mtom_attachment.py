@@ -76,3 +76,12 @@ def test_get_cid():
     cid = att.get_cid()
 
     assert isinstance(cid, bytes)
+
+
+def test_file_data_per_instance():
+    att1 = MtomAttachment(file=BytesIO(b'test 1'), file_name='test1.pdf')
+    att2 = MtomAttachment(file=BytesIO(b'test 2'), file_name='test2.txt')
+
+    assert att1.file_data == b'test 1'
+    assert att1.file_name == 'test1.pdf'
+    assert att2.file_data == b'test 2'
@@ -1,11 +1,16 @@
+import threading
 from io import BytesIO
 
 import pytest
 import responses
+from lxml import etree
 from zeep import Client
+from zeep.exceptions import Fault
 from zeep.settings import Settings
 
 from pymtom_xop import MtomAttachment, MtomTransport
+from pymtom_xop.soap_envelope import SoapEnvelope
+from pymtom_xop.xop_package import XopPackage, XopPackageFile
 
 
 @responses.activate
@@ -85,3 +90,174 @@ def test_add_files():
 
     with pytest.raises(TypeError, match='must be MtomAttachment objects'):
         transp.add_files(files=['asgdhjsag'])  # type: ignore
+
+
+@responses.activate
+def test_save_xml_and_post_package(tmp_path):
+    responses.add(
+        responses.POST,
+        "https://service-test.com/UploadFileWs",
+        body='mock response',
+        status=200
+    )
+
+    mtom_transport = MtomTransport()
+
+    file = MtomAttachment(file=BytesIO(b'test 123'), file_name='test.pdf')
+
+    mtom_transport.add_files(files=[file])
+
+    client = Client(wsdl="documents/UploadWSDL.wsdl", transport=mtom_transport)
+
+    factory = client.type_factory("ns0")
+
+    body = factory.uploadFileWs(
+        file=file.get_cid(),
+        fileName="test",
+        fileExtension="pdf"
+    )
+
+    file_path = str(tmp_path / "package.xop")
+
+    mtom_transport.save_xml(
+        file_path=file_path, client=client, operation="uploadFile", args=(body,)
+    )
+
+    # saved, not sent, with the headers Zeep would have sent
+    assert len(responses.calls) == 0
+    assert XopPackageFile(file_path=file_path).headers['SOAPAction'] == '""'
+    assert list(tmp_path.iterdir()) == [tmp_path / "package.xop"]
+
+    response = MtomTransport().post_package(
+        address="https://service-test.com/UploadFileWs",
+        file_path=file_path,
+        headers={'X-Test': '1'}
+    )
+    assert response.status_code == 200
+
+    request = responses.calls[0].request
+    sent_body = request.body.read() if hasattr(request.body, 'read') else request.body
+
+    assert request.headers['Content-Type'].startswith('multipart/related')
+    assert request.headers['SOAPAction'] == '""'
+    assert request.headers['X-Test'] == '1'
+    assert sent_body.startswith(b'--uuid:')
+    assert b'test 123' in sent_body
+
+
+SOAP_FAULT = (
+    '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    '<soap:Body><soap:Fault><faultcode>soap:Server</faultcode>'
+    '<faultstring>upload failed</faultstring></soap:Fault></soap:Body></soap:Envelope>'
+)
+
+
+@responses.activate
+def test_post_package_process_reply(tmp_path):
+    responses.add(
+        responses.POST,
+        "https://service-test.com/UploadFileWs",
+        body=SOAP_FAULT,
+        status=500,
+        content_type='text/xml'
+    )
+
+    mtom_transport = MtomTransport()
+
+    file = MtomAttachment(file=BytesIO(b'test 123'), file_name='test.pdf')
+
+    mtom_transport.add_files(files=[file])
+
+    client = Client(wsdl="documents/UploadWSDL.wsdl", transport=mtom_transport)
+
+    body = client.type_factory("ns0").uploadFileWs(
+        file=file.get_cid(),
+        fileName="test",
+        fileExtension="pdf"
+    )
+
+    file_path = str(tmp_path / "package.xop")
+
+    mtom_transport.save_xml(
+        file_path=file_path, client=client, operation="uploadFile", args=(body,)
+    )
+
+    # unparsed response by default
+    response = mtom_transport.post_package(
+        address="https://service-test.com/UploadFileWs", file_path=file_path
+    )
+    assert response.status_code == 500
+
+    with pytest.raises(Fault, match='upload failed'):
+        mtom_transport.post_package(
+            address="https://service-test.com/UploadFileWs",
+            file_path=file_path,
+            service=client.service,
+            operation="uploadFile"
+        )
+
+    with pytest.raises(ValueError, match='must be given together'):
+        mtom_transport.post_package(
+            address="https://service-test.com/UploadFileWs",
+            file_path=file_path,
+            service=client.service
+        )
+
+
+def test_save_xml_requires_own_client(tmp_path):
+    client = Client(wsdl="documents/UploadWSDL.wsdl", transport=MtomTransport())
+
+    with pytest.raises(ValueError, match='must use this MtomTransport'):
+        MtomTransport().save_xml(
+            file_path=str(tmp_path / "package.xop"), client=client, operation="uploadFile"
+        )
+
+
+def test_xop_package_save_rejects_crlf(tmp_path):
+    file_path = str(tmp_path / "package.xop")
+
+    soap_env = SoapEnvelope(env_el=etree.fromstring(SOAP_FAULT), files=[])
+    xop_pack = XopPackage(soap_env=soap_env, files=[])
+
+    with pytest.raises(ValueError, match='must not contain CR or LF'):
+        xop_pack.save(file_path=file_path, headers={'SOAPAction': 'a\r\nX-Injected: 1'})
+
+
+def test_xop_package_file_invalid(tmp_path):
+    file_path = tmp_path / "package.xop"
+    file_path.write_bytes(b'MIME-Version: 1.0\r\n')
+
+    with pytest.raises(ValueError, match='end of headers not found'):
+        XopPackageFile(file_path=str(file_path))
+
+    file_path.write_bytes(b'MIME-Version: \xff\xfe\r\n\r\n')
+
+    with pytest.raises(ValueError, match='invalid header line'):
+        XopPackageFile(file_path=str(file_path))
+
+
+def test_use_files():
+    transp = MtomTransport()
+
+    shared = MtomAttachment(file=BytesIO(b'shared'), file_name='shared.pdf')
+    transp.add_files(files=[shared])
+
+    own = MtomAttachment(file=BytesIO(b'own'), file_name='own.pdf')
+
+    seen_by_other_thread = []
+
+    with transp.use_files(files=[own]):
+        assert transp._MtomTransport__get_files() == [own]  # type: ignore
+
+        other = threading.Thread(
+            target=lambda: seen_by_other_thread.extend(transp._MtomTransport__get_files())  # type: ignore
+        )
+        other.start()
+        other.join()
+
+    assert seen_by_other_thread == [shared]
+    assert transp._MtomTransport__get_files() == [shared]  # type: ignore
+
+    with pytest.raises(TypeError, match='must be MtomAttachment objects'):
+        with transp.use_files(files=['asgdhjsag']):  # type: ignore
+            pass